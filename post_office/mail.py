@@ -274,7 +274,7 @@ def send_queued(processes=1, log_level=None):
     total_email = len(queued_emails)
 
     logger.info(
-        "Started sending %s emails with %s processes." % (total_email, processes)
+        "Started sending %s emails with %s processes.", total_email, processes
     )
 
     if log_level is None:
@@ -325,7 +325,7 @@ def _send_bulk(emails, uses_multiprocessing=True, log_level=None):
     failed_emails = []  # This is a list of two tuples (email, exception)
     email_count = len(emails)
 
-    logger.info("Process started, sending %s emails" % email_count)
+    logger.info("Process started, sending %s emails", email_count)
 
     def send(email):
         try:
@@ -333,9 +333,9 @@ def _send_bulk(emails, uses_multiprocessing=True, log_level=None):
                 log_level=log_level, commit=False, disconnect_after_delivery=False
             )
             sent_emails.append(email)
-            logger.debug("Successfully sent email #%d" % email.id)
+            logger.debug("Successfully sent email #%d", email.id)
         except Exception as e:
-            logger.debug("Failed to send email #%d" % email.id)
+            logger.debug("Failed to send email #%d", email.id)
             failed_emails.append((email, e))
 
     # Prepare emails before we send these to threads for sending
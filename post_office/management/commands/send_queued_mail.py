@@ -36,7 +36,7 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
-        logger.info('Acquiring lock for sending queued emails at %s.lock' %
+        logger.info('Acquiring lock for sending queued emails at %s.lock',
                     options['lockfile'])
         try:
             with FileLock(options['lockfile']):